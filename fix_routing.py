@@ -1,32 +1,50 @@
 #!/usr/bin/env python3
 """Remove duplicate code from routing.rs"""
 
-with open('/mnt/c/dev/network test/src/routing.rs', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
-
-# Find and remove lines 480-492 (0-indexed: 479-491)
-# Line 480 starts with "}縺ｯ縺昴・..." - detect this broken line
-new_lines = []
-skip_until = None
-for i, line in enumerate(lines):
-    line_num = i + 1  # 1-indexed
-    
-    # Detect the start of duplicate block (line 480)
-    if '}縺ｯ縺昴・縺ｾ縺ｾ' in line or (line_num >= 480 and line_num <= 492 and skip_until is None):
-        if '}縺ｯ' in line:
-            # Replace broken line with just "}"
-            new_lines.append('                }\n')
-            skip_until = 493  # Skip until line 493
-            print(f"Found broken line at {line_num}, skipping until line {skip_until}")
-            continue
-    
-    if skip_until and line_num < skip_until:
-        print(f"Skipping line {line_num}: {line[:50]}...")
-        continue
-    
-    new_lines.append(line)
-
-with open('/mnt/c/dev/network test/src/routing.rs', 'w', encoding='utf-8') as f:
-    f.writelines(new_lines)
-
-print(f"Done - removed duplicate code. New line count: {len(new_lines)}")
+import sys
+
+PATH = '/mnt/c/dev/network test/src/routing.rs'
+# Line 480 starts with "}縺ｯ縺昴・..." - the duplicate block runs through line 492
+MARKER = '}縺ｯ縺昴・縺ｾ縺ｾ'
+LAST_DUPLICATE_LINE = 492
+
+verbose = '--verbose' in sys.argv[1:]
+
+with open(PATH, 'r', encoding='utf-8') as f:
+    src = f.read()
+
+i = src.find(MARKER)
+if i < 0:
+    print("Broken line not found - nothing to do")
+    sys.exit(0)
+
+line_start = src.rfind('\n', 0, i) + 1
+line_num = src.count('\n', 0, line_start) + 1  # 1-indexed
+print(f"Found broken line at {line_num}, skipping until line {LAST_DUPLICATE_LINE + 1}")
+
+# Advance past the broken line and the rest of the duplicate block
+end = line_start
+for _ in range(max(LAST_DUPLICATE_LINE - line_num, 0) + 1):
+    nl = src.find('\n', end)
+    if nl < 0:
+        end = len(src)
+        break
+    end = nl + 1
+
+if verbose:
+    # Split on '\n' only, as readlines() does; splitlines() would also break
+    # on form feeds and Unicode separators and shift the line numbers
+    skipped = src[line_start:end].split('\n')[1:]
+    if skipped and skipped[-1] == '':
+        skipped.pop()  # the block ends with a newline
+    for n, line in enumerate(skipped, start=line_num + 1):
+        print(f"Skipping line {n}: {line[:50]}...")
+
+# Replace broken line with just "}"
+out = src[:line_start] + '                }\n' + src[end:]
+
+with open(PATH, 'w', encoding='utf-8') as f:
+    f.write(out)
+
+new_line_count = out.count('\n') + (not out.endswith('\n'))
+print(f"Done - removed duplicate code. New line count: {new_line_count}")
@@ -0,0 +1,90 @@
+"""
+JSON loading, streaming and caching helpers shared by the analysis scripts.
+"""
+
+import json
+import os
+import pickle
+from pathlib import Path
+
+try:
+    import ijson
+except ImportError:  # optional: fall back to loading the whole document
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the standard json module
+    orjson = None
+
+# Errors raised for malformed input by either loading path
+JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson else ())
+
+# Inputs at least this large are streamed rather than loaded whole
+STREAMING_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+
+def load_json(path):
+    """Parse a JSON file, using orjson when available."""
+    if orjson is None:
+        with open(path, 'r') as f:
+            return json.load(f)
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def dump_json(obj, path):
+    """Write obj to path as indented JSON, using orjson when available."""
+    if orjson is None:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+        return
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+
+def iter_json_results(path):
+    """Yield records from a JSON array or an object's 'results' array, streaming large files."""
+    if ijson is None or os.path.getsize(path) < STREAMING_THRESHOLD_BYTES:
+        data = load_json(path)
+        yield from data if isinstance(data, list) else data.get('results', [])
+        return
+    
+    with open(path, 'rb') as f:
+        # The first parse event tells a bare array from an object; only a
+        # single read buffer is parsed before rewinding for the real pass
+        first_event, _ = next(ijson.basic_parse(f))
+        f.seek(0)
+        prefix = 'item' if first_event == 'start_array' else 'results.item'
+        yield from ijson.items(f, prefix, use_float=True)
+
+
+def load_json_cached(path):
+    """Parse a JSON file, reusing <path>.pkl while the file's mtime and size match."""
+    # The cache is unpickled, so anyone able to write <path>.pkl can run code
+    # as the caller; only use this on files in directories you trust
+    path = Path(path)
+    cache = path.with_name(path.name + '.pkl')
+    st = path.stat()
+    source = (st.st_mtime_ns, st.st_size)
+    
+    try:
+        with open(cache, 'rb') as f:
+            # The source key is pickled ahead of the data, so a stale
+            # cache is rejected without deserializing its payload
+            if pickle.load(f) == source:
+                return pickle.load(f)
+    except Exception:  # missing, unreadable or corrupt cache; reparse the JSON
+        pass
+    
+    data = load_json(path)
+    
+    try:
+        tmp = cache.with_name(cache.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            pickle.dump(source, f, protocol=5)
+            pickle.dump(data, f, protocol=5)
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+    return data
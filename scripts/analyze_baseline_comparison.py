@@ -3,167 +3,171 @@
 Analyze baseline comparison results and generate summary report.
 """
 
-import json
 import sys
 from collections import defaultdict
+from operator import itemgetter
 
-def load_results(filename):
-    """Load results from JSON file."""
-    with open(filename, 'r') as f:
-        data = json.load(f)
-    return data['results']
+from _json_cache import JSON_ERRORS, iter_json_results
 
-def analyze_by_protocol(results):
+# Fields read from each result record, fetched in one C-level call
+_RESULT_FIELDS = itemgetter('protocol', 'topology', 'network_size',
+                            'success_rate', 'avg_hops', 'avg_latency_us')
+
+def _new_accumulator():
+    """Running totals: [count, sum_success, sum_hops, sum_latency]."""
+    return [0, 0.0, 0.0, 0.0]
+
+def aggregate_results(results):
+    """Accumulate sorted per-protocol, per-topology and per-size totals in one pass."""
+    by_protocol = defaultdict(_new_accumulator)
+    by_topology = defaultdict(_new_accumulator)
+    by_size = defaultdict(_new_accumulator)
+    
+    for protocol, topology, size, success, hops, latency in map(_RESULT_FIELDS, results):
+        for acc in (by_protocol[protocol],
+                    by_topology[(topology, protocol)],
+                    by_size[(size, protocol)]):
+            acc[0] += 1
+            acc[1] += success
+            acc[2] += hops
+            acc[3] += latency
+    
+    return tuple({key: groups[key] for key in sorted(groups)}
+                 for groups in (by_protocol, by_topology, by_size))
+
+def averages(acc):
+    """Return (avg_success, avg_hops, avg_latency) for an accumulator."""
+    count = acc[0]
+    return acc[1] / count, acc[2] / count, acc[3] / count
+
+def analyze_by_protocol(by_protocol):
     """Analyze results grouped by protocol."""
-    by_protocol = defaultdict(list)
+    lines = []
+    out = lines.append
     
-    for result in results:
-        by_protocol[result['protocol']].append(result)
+    out("=" * 80)
+    out("ANALYSIS BY PROTOCOL")
+    out("=" * 80)
+    out("")
     
-    print("=" * 80)
-    print("ANALYSIS BY PROTOCOL")
-    print("=" * 80)
-    print()
-    
-    for protocol in sorted(by_protocol.keys()):
-        protocol_results = by_protocol[protocol]
+    for protocol, acc in by_protocol.items():
+        avg_success, avg_hops, avg_latency = averages(acc)
         
-        avg_success = sum(r['success_rate'] for r in protocol_results) / len(protocol_results)
-        avg_hops = sum(r['avg_hops'] for r in protocol_results) / len(protocol_results)
-        avg_latency = sum(r['avg_latency_us'] for r in protocol_results) / len(protocol_results)
-        
-        print(f"{protocol}:")
-        print(f"  Average Success Rate: {avg_success * 100:.2f}%")
-        print(f"  Average Hop Count: {avg_hops:.2f}")
-        print(f"  Average Latency: {avg_latency:.2f} μs")
-        print()
+        out(f"{protocol}:")
+        out(f"  Average Success Rate: {avg_success * 100:.2f}%")
+        out(f"  Average Hop Count: {avg_hops:.2f}")
+        out(f"  Average Latency: {avg_latency:.2f} μs")
+        out("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def analyze_by_topology(results):
+def analyze_by_topology(by_topology):
     """Analyze results grouped by topology."""
-    by_topology = defaultdict(lambda: defaultdict(list))
-    
-    for result in results:
-        by_topology[result['topology']][result['protocol']].append(result)
-    
-    print("=" * 80)
-    print("ANALYSIS BY TOPOLOGY")
-    print("=" * 80)
-    print()
-    
-    for topology in sorted(by_topology.keys()):
-        print(f"{topology.upper()} Topology:")
-        print()
+    lines = []
+    out = lines.append
+    
+    out("=" * 80)
+    out("ANALYSIS BY TOPOLOGY")
+    out("=" * 80)
+    out("")
+    
+    current_topology = None
+    for (topology, protocol), acc in by_topology.items():
+        if topology != current_topology:
+            if current_topology is not None:
+                out("")
+            out(f"{topology.upper()} Topology:")
+            out("")
+            current_topology = topology
         
-        for protocol in sorted(by_topology[topology].keys()):
-            protocol_results = by_topology[topology][protocol]
-            
-            avg_success = sum(r['success_rate'] for r in protocol_results) / len(protocol_results)
-            avg_hops = sum(r['avg_hops'] for r in protocol_results) / len(protocol_results)
-            avg_latency = sum(r['avg_latency_us'] for r in protocol_results) / len(protocol_results)
-            
-            print(f"  {protocol}:")
-            print(f"    Success Rate: {avg_success * 100:.2f}%")
-            print(f"    Avg Hops: {avg_hops:.2f}")
-            print(f"    Avg Latency: {avg_latency:.2f} μs")
-        print()
+        avg_success, avg_hops, avg_latency = averages(acc)
+        
+        out(f"  {protocol}:")
+        out(f"    Success Rate: {avg_success * 100:.2f}%")
+        out(f"    Avg Hops: {avg_hops:.2f}")
+        out(f"    Avg Latency: {avg_latency:.2f} μs")
+    if current_topology is not None:
+        out("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def analyze_scalability(results):
+def analyze_scalability(by_size):
     """Analyze scalability trends."""
-    by_size = defaultdict(lambda: defaultdict(list))
+    lines = []
+    out = lines.append
     
-    for result in results:
-        by_size[result['network_size']][result['protocol']].append(result)
+    out("=" * 80)
+    out("SCALABILITY ANALYSIS")
+    out("=" * 80)
+    out("")
     
-    print("=" * 80)
-    print("SCALABILITY ANALYSIS")
-    print("=" * 80)
-    print()
+    out(f"{'Size':<10} {'Protocol':<12} {'Success %':<12} {'Avg Hops':<12} {'Avg Latency(μs)':<15}")
+    out("-" * 80)
     
-    print(f"{'Size':<10} {'Protocol':<12} {'Success %':<12} {'Avg Hops':<12} {'Avg Latency(μs)':<15}")
-    print("-" * 80)
-    
-    for size in sorted(by_size.keys()):
-        for protocol in sorted(by_size[size].keys()):
-            protocol_results = by_size[size][protocol]
-            
-            avg_success = sum(r['success_rate'] for r in protocol_results) / len(protocol_results)
-            avg_hops = sum(r['avg_hops'] for r in protocol_results) / len(protocol_results)
-            avg_latency = sum(r['avg_latency_us'] for r in protocol_results) / len(protocol_results)
-            
-            print(f"{size:<10} {protocol:<12} {avg_success * 100:<12.2f} {avg_hops:<12.2f} {avg_latency:<15.2f}")
-    print()
+    for (size, protocol), acc in by_size.items():
+        avg_success, avg_hops, avg_latency = averages(acc)
+        
+        out(f"{size:<10} {protocol:<12} {avg_success * 100:<12.2f} {avg_hops:<12.2f} {avg_latency:<15.2f}")
+    out("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def generate_comparison_summary(results):
+def generate_comparison_summary(by_protocol):
     """Generate a comparison summary."""
-    print("=" * 80)
-    print("COMPARISON SUMMARY")
-    print("=" * 80)
-    print()
+    lines = []
+    out = lines.append
     
-    # Group by protocol
-    by_protocol = defaultdict(list)
-    for result in results:
-        by_protocol[result['protocol']].append(result)
+    out("=" * 80)
+    out("COMPARISON SUMMARY")
+    out("=" * 80)
+    out("")
     
     # Calculate overall metrics
-    print("Overall Performance (averaged across all tests):")
-    print()
-    print(f"{'Protocol':<12} {'Success %':<12} {'Avg Hops':<12} {'Avg Latency(μs)':<15}")
-    print("-" * 60)
+    out("Overall Performance (averaged across all tests):")
+    out("")
+    out(f"{'Protocol':<12} {'Success %':<12} {'Avg Hops':<12} {'Avg Latency(μs)':<15}")
+    out("-" * 60)
     
-    for protocol in sorted(by_protocol.keys()):
-        protocol_results = by_protocol[protocol]
-        
-        avg_success = sum(r['success_rate'] for r in protocol_results) / len(protocol_results)
-        avg_hops = sum(r['avg_hops'] for r in protocol_results) / len(protocol_results)
-        avg_latency = sum(r['avg_latency_us'] for r in protocol_results) / len(protocol_results)
-        
-        print(f"{protocol:<12} {avg_success * 100:<12.2f} {avg_hops:<12.2f} {avg_latency:<15.2f}")
+    # (avg_success, avg_hops, avg_latency) per protocol, in sorted order
+    means = {protocol: averages(acc) for protocol, acc in by_protocol.items()}
     
-    print()
-    print("Key Findings:")
-    print()
+    for protocol, (avg_success, avg_hops, avg_latency) in means.items():
+        out(f"{protocol:<12} {avg_success * 100:<12.2f} {avg_hops:<12.2f} {avg_latency:<15.2f}")
+    
+    out("")
+    out("Key Findings:")
+    out("")
     
     # Find best in each category
-    all_by_protocol = {}
-    for protocol in by_protocol.keys():
-        protocol_results = by_protocol[protocol]
-        all_by_protocol[protocol] = {
-            'success': sum(r['success_rate'] for r in protocol_results) / len(protocol_results),
-            'hops': sum(r['avg_hops'] for r in protocol_results) / len(protocol_results),
-            'latency': sum(r['avg_latency_us'] for r in protocol_results) / len(protocol_results)
-        }
-    
-    best_success = max(all_by_protocol.items(), key=lambda x: x[1]['success'])
-    best_hops = min(all_by_protocol.items(), key=lambda x: x[1]['hops'])
-    best_latency = min(all_by_protocol.items(), key=lambda x: x[1]['latency'])
-    
-    print(f"1. Highest Success Rate: {best_success[0]} ({best_success[1]['success'] * 100:.2f}%)")
-    print(f"2. Lowest Hop Count: {best_hops[0]} ({best_hops[1]['hops']:.2f} hops)")
-    print(f"3. Lowest Latency: {best_latency[0]} ({best_latency[1]['latency']:.2f} μs)")
-    print()
+    best_success = max(means.items(), key=lambda kv: kv[1][0])
+    best_hops = min(means.items(), key=lambda kv: kv[1][1])
+    best_latency = min(means.items(), key=lambda kv: kv[1][2])
+    
+    out(f"1. Highest Success Rate: {best_success[0]} ({best_success[1][0] * 100:.2f}%)")
+    out(f"2. Lowest Hop Count: {best_hops[0]} ({best_hops[1][1]:.2f} hops)")
+    out(f"3. Lowest Latency: {best_latency[0]} ({best_latency[1][2]:.2f} μs)")
+    out("")
     
     # DRFE-R specific analysis
-    if 'DRFE-R' in all_by_protocol:
-        drfer = all_by_protocol['DRFE-R']
-        print("DRFE-R Performance:")
-        print(f"  - Success Rate: {drfer['success'] * 100:.2f}%")
-        print(f"  - Average Hops: {drfer['hops']:.2f}")
-        print(f"  - Average Latency: {drfer['latency']:.2f} μs")
-        print()
+    drfer = means.get('DRFE-R')
+    if drfer is not None:
+        drfer_success, drfer_hops, drfer_latency = drfer
+        out("DRFE-R Performance:")
+        out(f"  - Success Rate: {drfer_success * 100:.2f}%")
+        out(f"  - Average Hops: {drfer_hops:.2f}")
+        out(f"  - Average Latency: {drfer_latency:.2f} μs")
+        out("")
         
         # Compare with others
-        if 'Chord' in all_by_protocol:
-            chord = all_by_protocol['Chord']
-            hop_diff = ((drfer['hops'] - chord['hops']) / chord['hops']) * 100
-            print(f"  vs Chord: {hop_diff:+.1f}% hops")
-        
-        if 'Kademlia' in all_by_protocol:
-            kad = all_by_protocol['Kademlia']
-            hop_diff = ((drfer['hops'] - kad['hops']) / kad['hops']) * 100
-            print(f"  vs Kademlia: {hop_diff:+.1f}% hops")
+        for baseline in ('Chord', 'Kademlia'):
+            other = means.get(baseline)
+            if other is not None:
+                hop_diff = ((drfer_hops - other[1]) / other[1]) * 100
+                out(f"  vs {baseline}: {hop_diff:+.1f}% hops")
     
-    print()
+    out("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     if len(sys.argv) > 1:
@@ -172,19 +176,19 @@ def main():
         filename = 'baseline_comparison.json'
     
     try:
-        results = load_results(filename)
+        by_protocol, by_topology, by_size = aggregate_results(iter_json_results(filename))
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         sys.exit(1)
-    except json.JSONDecodeError:
+    except JSON_ERRORS:
         print(f"Error: Invalid JSON in '{filename}'.")
         sys.exit(1)
     
     print()
-    analyze_by_protocol(results)
-    analyze_by_topology(results)
-    analyze_scalability(results)
-    generate_comparison_summary(results)
+    analyze_by_protocol(by_protocol)
+    analyze_by_topology(by_topology)
+    analyze_scalability(by_size)
+    generate_comparison_summary(by_protocol)
 
 if __name__ == '__main__':
     main()
@@ -9,11 +9,12 @@ analysis and visualizations for the research paper.
 import json
 import sys
 
+from _json_cache import load_json_cached
+
 def load_results(filename='scalability_results.json'):
     """Load experiment results from JSON file."""
     try:
-        with open(filename, 'r') as f:
-            return json.load(f)
+        return load_json_cached(filename)
     except FileNotFoundError:
         print(f"Error: {filename} not found")
         sys.exit(1)
@@ -23,49 +24,62 @@ def load_results(filename='scalability_results.json'):
 
 def print_summary_table(results):
     """Print a formatted summary table."""
-    print("\n=== Scalability Summary Table ===\n")
-    print(f"{'Size':<8} {'Success%':<10} {'Avg Hops':<10} {'Stretch':<10} {'Time(μs)':<12} {'Memory(MB)':<12}")
-    print("-" * 72)
+    lines = []
+    out = lines.append
+    
+    out("\n=== Scalability Summary Table ===\n")
+    out(f"{'Size':<8} {'Success%':<10} {'Avg Hops':<10} {'Stretch':<10} {'Time(μs)':<12} {'Memory(MB)':<12}")
+    out("-" * 72)
     
     for r in results:
-        print(f"{r['network_size']:<8} "
-              f"{r['success_rate']*100:<10.2f} "
-              f"{r['avg_hops']:<10.2f} "
-              f"{r['avg_stretch']:<10.3f} "
-              f"{r['avg_routing_time_us']:<12.2f} "
-              f"{r['total_memory_mb']:<12.2f}")
+        out(f"{r['network_size']:<8} "
+            f"{r['success_rate']*100:<10.2f} "
+            f"{r['avg_hops']:<10.2f} "
+            f"{r['avg_stretch']:<10.3f} "
+            f"{r['avg_routing_time_us']:<12.2f} "
+            f"{r['total_memory_mb']:<12.2f}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def print_complexity_analysis(results):
     """Print complexity analysis."""
-    print("\n=== Complexity Analysis ===\n")
+    lines = []
+    out = lines.append
     
-    print("Routing Complexity (O(k) per hop):")
-    print(f"{'Size':<8} {'Avg Hops':<12} {'Avg Degree':<12} {'Ratio':<10}")
-    print("-" * 42)
+    out("\n=== Complexity Analysis ===\n")
+    
+    out("Routing Complexity (O(k) per hop):")
+    out(f"{'Size':<8} {'Avg Hops':<12} {'Avg Degree':<12} {'Ratio':<10}")
+    out("-" * 42)
     for r in results:
         ratio = r['avg_hops'] / r['avg_degree'] if r['avg_degree'] > 0 else 0
-        print(f"{r['network_size']:<8} {r['avg_hops']:<12.2f} {r['avg_degree']:<12.2f} {ratio:<10.2f}")
+        out(f"{r['network_size']:<8} {r['avg_hops']:<12.2f} {r['avg_degree']:<12.2f} {ratio:<10.2f}")
     
-    print("\nMemory Complexity (O(k) per node):")
-    print(f"{'Size':<8} {'Mem/Node':<12} {'Avg Degree':<12} {'Bytes/Neighbor':<15}")
-    print("-" * 47)
+    out("\nMemory Complexity (O(k) per node):")
+    out(f"{'Size':<8} {'Mem/Node':<12} {'Avg Degree':<12} {'Bytes/Neighbor':<15}")
+    out("-" * 47)
     for r in results:
         bytes_per_neighbor = r['memory_per_node_bytes'] / r['avg_degree'] if r['avg_degree'] > 0 else 0
-        print(f"{r['network_size']:<8} {r['memory_per_node_bytes']:<12} "
-              f"{r['avg_degree']:<12.2f} {bytes_per_neighbor:<15.1f}")
+        out(f"{r['network_size']:<8} {r['memory_per_node_bytes']:<12} "
+            f"{r['avg_degree']:<12.2f} {bytes_per_neighbor:<15.1f}")
     
-    print("\nEmbedding Complexity (O(|E|)):")
-    print(f"{'Size':<8} {'Time(ms)':<12} {'Edges':<10} {'ms/edge':<12}")
-    print("-" * 42)
+    out("\nEmbedding Complexity (O(|E|)):")
+    out(f"{'Size':<8} {'Time(ms)':<12} {'Edges':<10} {'ms/edge':<12}")
+    out("-" * 42)
     for r in results:
-        print(f"{r['network_size']:<8} {r['embedding_time_ms']:<12} "
-              f"{r['num_edges']:<10} {r['embedding_complexity_per_edge']:<12.6f}")
+        out(f"{r['network_size']:<8} {r['embedding_time_ms']:<12} "
+            f"{r['num_edges']:<10} {r['embedding_complexity_per_edge']:<12.6f}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def print_mode_distribution(results):
     """Print routing mode distribution."""
-    print("\n=== Routing Mode Distribution ===\n")
-    print(f"{'Size':<8} {'Gravity%':<12} {'Pressure%':<12} {'Tree%':<12}")
-    print("-" * 44)
+    lines = []
+    out = lines.append
+    
+    out("\n=== Routing Mode Distribution ===\n")
+    out(f"{'Size':<8} {'Gravity%':<12} {'Pressure%':<12} {'Tree%':<12}")
+    out("-" * 44)
     
     for r in results:
         total_hops = r['gravity_hops'] + r['pressure_hops'] + r['tree_hops']
@@ -76,44 +90,56 @@ def print_mode_distribution(results):
         else:
             gravity_pct = pressure_pct = tree_pct = 0
         
-        print(f"{r['network_size']:<8} {gravity_pct:<12.1f} {pressure_pct:<12.1f} {tree_pct:<12.1f}")
+        out(f"{r['network_size']:<8} {gravity_pct:<12.1f} {pressure_pct:<12.1f} {tree_pct:<12.1f}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def print_hop_statistics(results):
     """Print hop count statistics."""
-    print("\n=== Hop Count Statistics ===\n")
-    print(f"{'Size':<8} {'Avg':<10} {'Median':<10} {'P95':<10} {'Max':<10}")
-    print("-" * 48)
+    lines = []
+    out = lines.append
+    
+    out("\n=== Hop Count Statistics ===\n")
+    out(f"{'Size':<8} {'Avg':<10} {'Median':<10} {'P95':<10} {'Max':<10}")
+    out("-" * 48)
     
     for r in results:
-        print(f"{r['network_size']:<8} "
-              f"{r['avg_hops']:<10.2f} "
-              f"{r['median_hops']:<10} "
-              f"{r['p95_hops']:<10} "
-              f"{r['max_hops']:<10}")
+        out(f"{r['network_size']:<8} "
+            f"{r['avg_hops']:<10.2f} "
+            f"{r['median_hops']:<10} "
+            f"{r['p95_hops']:<10} "
+            f"{r['max_hops']:<10}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def generate_latex_table(results):
     """Generate LaTeX table for paper."""
-    print("\n=== LaTeX Table for Paper ===\n")
-    print("\\begin{table}[h]")
-    print("\\centering")
-    print("\\caption{Scalability Experiment Results}")
-    print("\\label{tab:scalability}")
-    print("\\begin{tabular}{rrrrrr}")
-    print("\\hline")
-    print("Size & Success & Avg Hops & Stretch & Time ($\\mu$s) & Memory (MB) \\\\")
-    print("\\hline")
+    lines = []
+    out = lines.append
+    
+    out("\n=== LaTeX Table for Paper ===\n")
+    out("\\begin{table}[h]")
+    out("\\centering")
+    out("\\caption{Scalability Experiment Results}")
+    out("\\label{tab:scalability}")
+    out("\\begin{tabular}{rrrrrr}")
+    out("\\hline")
+    out("Size & Success & Avg Hops & Stretch & Time ($\\mu$s) & Memory (MB) \\\\")
+    out("\\hline")
     
     for r in results:
-        print(f"{r['network_size']} & "
-              f"{r['success_rate']*100:.1f}\\% & "
-              f"{r['avg_hops']:.2f} & "
-              f"{r['avg_stretch']:.2f} & "
-              f"{r['avg_routing_time_us']:.1f} & "
-              f"{r['total_memory_mb']:.2f} \\\\")
-    
-    print("\\hline")
-    print("\\end{tabular}")
-    print("\\end{table}")
+        out(f"{r['network_size']} & "
+            f"{r['success_rate']*100:.1f}\\% & "
+            f"{r['avg_hops']:.2f} & "
+            f"{r['avg_stretch']:.2f} & "
+            f"{r['avg_routing_time_us']:.1f} & "
+            f"{r['total_memory_mb']:.2f} \\\\")
+    
+    out("\\hline")
+    out("\\end{tabular}")
+    out("\\end{table}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Main analysis function."""
@@ -3,14 +3,10 @@
 Analyze topology experiment results and generate summary statistics
 """
 
-import json
 import sys
 from pathlib import Path
 
-def load_results(filename):
-    """Load experiment results from JSON file"""
-    with open(filename, 'r') as f:
-        return json.load(f)
+from _json_cache import load_json_cached
 
 def analyze_results(results, network_size):
     """Analyze and print results for a given network size"""
@@ -51,7 +47,7 @@ def generate_summary():
         size_str = result_file.stem.split('_n')[1]
         network_size = int(size_str)
         
-        results = load_results(result_file)
+        results = load_json_cached(result_file)
         all_data[network_size] = results
         
         analyze_results(results, network_size)
@@ -6,28 +6,45 @@ For DRFE-R paper publication.
 
 import csv
 import json
+from collections import defaultdict
 from pathlib import Path
 
 def load_csv_data(csv_path):
     """Load ablation summary CSV."""
-    data = []
-    with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            data.append({
-                'topology': row['topology'],
-                'n': int(row['n']),
-                'embedding': row['embedding'],
-                'success_rate': float(row['success_rate']),
-                'avg_hops': float(row['avg_hops']),
-                'stretch': float(row['stretch']),
-                'gravity_ratio': float(row['gravity_ratio']),
-                'pressure_ratio': float(row['pressure_ratio']),
-                'tree_ratio': float(row['tree_ratio']),
-            })
-    return data
+    with open(csv_path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        # Resolve column positions once instead of building a dict per row
+        (topology, n, embedding, success_rate, avg_hops, stretch,
+         gravity_ratio, pressure_ratio, tree_ratio) = (
+            header.index(name) for name in (
+                'topology', 'n', 'embedding', 'success_rate', 'avg_hops',
+                'stretch', 'gravity_ratio', 'pressure_ratio', 'tree_ratio'))
+        
+        return [{
+            'topology': row[topology],
+            'n': int(row[n]),
+            'embedding': row[embedding],
+            'success_rate': float(row[success_rate]),
+            'avg_hops': float(row[avg_hops]),
+            'stretch': float(row[stretch]),
+            'gravity_ratio': float(row[gravity_ratio]),
+            'pressure_ratio': float(row[pressure_ratio]),
+            'tree_ratio': float(row[tree_ratio]),
+        } for row in reader if row]  # DictReader also skipped blank lines
+
+def index_data(data):
+    """Index rows by (topology, n) and by (topology, n, embedding)."""
+    by_config = defaultdict(list)
+    by_key = {}
+    for d in data:
+        key = (d['topology'], d['n'])
+        by_config[key].append(d)
+        # Keep the first row per key, as the previous linear search did
+        by_key.setdefault(key + (d['embedding'],), d)
+    return by_config, by_key
 
-def generate_latex_success_table(data):
+def generate_latex_success_table(by_config, by_key):
     """Generate LaTeX table for success rates by topology and embedding."""
     
     # Group by topology and n
@@ -35,19 +52,18 @@ def generate_latex_success_table(data):
     embeddings = ['PIE', 'Random', 'Ricci-Broken', 'Ricci-Fixed']
     scales = [50, 100, 200, 300]
     
-    latex = r"""\begin{table}[htbp]
+    parts = [r"""\begin{table}[htbp]
 \centering
 \caption{Routing Success Rate by Topology and Embedding Strategy}
 \label{tab:success-rate}
 \begin{tabular}{llcccc}
 \toprule
 Topology & N & PIE & Random & Ricci-Broken & Ricci-Fixed \\
-\midrule
-"""
+\midrule"""]
     
     for topo in topologies:
         for n in scales:
-            row_data = [d for d in data if d['topology'] == topo and d['n'] == n]
+            row_data = by_config.get((topo, n))
             if not row_data:
                 continue
             
@@ -55,9 +71,9 @@ Topology & N & PIE & Random & Ricci-Broken & Ricci-Fixed \\
             line = f"{topo_label} & {n}"
             
             for emb in embeddings:
-                match = [d for d in row_data if d['embedding'] == emb]
+                match = by_key.get((topo, n, emb))
                 if match:
-                    sr = match[0]['success_rate']
+                    sr = match['success_rate']
                     # Bold if 100%
                     if sr >= 0.999:
                         line += f" & \\textbf{{{sr*100:.1f}\\%}}"
@@ -69,34 +85,32 @@ Topology & N & PIE & Random & Ricci-Broken & Ricci-Fixed \\
             line += r" \\"
             if n == 300:
                 line += r"\midrule"
-            latex += line + "\n"
+            parts.append(line)
     
-    latex += r"""\bottomrule
+    parts.append(r"""\bottomrule
 \end{tabular}
-\end{table}
-"""
-    return latex
+\end{table}""")
+    return "\n".join(parts) + "\n"
 
-def generate_latex_hops_table(data):
+def generate_latex_hops_table(by_config, by_key):
     """Generate LaTeX table for average hops."""
     
     topologies = ['ba', 'ws', 'grid']  # Only main topologies for this table
     embeddings = ['PIE', 'Random', 'Ricci-Broken', 'Ricci-Fixed']
     scales = [100, 200, 300]
     
-    latex = r"""\begin{table}[htbp]
+    parts = [r"""\begin{table}[htbp]
 \centering
 \caption{Average Hop Count by Topology and Embedding Strategy}
 \label{tab:avg-hops}
 \begin{tabular}{llcccc}
 \toprule
 Topology & N & PIE & Random & Ricci-Broken & Ricci-Fixed \\
-\midrule
-"""
+\midrule"""]
     
     for topo in topologies:
         for n in scales:
-            row_data = [d for d in data if d['topology'] == topo and d['n'] == n]
+            row_data = by_config.get((topo, n))
             if not row_data:
                 continue
             
@@ -108,9 +122,9 @@ Topology & N & PIE & Random & Ricci-Broken & Ricci-Fixed \\
             min_hops = min(hops_values) if hops_values else 0
             
             for emb in embeddings:
-                match = [d for d in row_data if d['embedding'] == emb]
+                match = by_key.get((topo, n, emb))
                 if match:
-                    hops = match[0]['avg_hops']
+                    hops = match['avg_hops']
                     if abs(hops - min_hops) < 0.01:
                         line += f" & \\textbf{{{hops:.1f}}}"
                     else:
@@ -121,32 +135,30 @@ Topology & N & PIE & Random & Ricci-Broken & Ricci-Fixed \\
             line += r" \\"
             if n == 300 and topo != 'grid':
                 line += r"\midrule"
-            latex += line + "\n"
+            parts.append(line)
     
-    latex += r"""\bottomrule
+    parts.append(r"""\bottomrule
 \end{tabular}
-\end{table}
-"""
-    return latex
+\end{table}""")
+    return "\n".join(parts) + "\n"
 
-def generate_hop_breakdown_table(data):
+def generate_hop_breakdown_table(by_config):
     """Generate table showing Gravity/Pressure/Tree breakdown."""
     
     topologies = ['ba', 'ws', 'grid']
     scale = 300  # Focus on largest scale
     
-    latex = r"""\begin{table}[htbp]
+    parts = [r"""\begin{table}[htbp]
 \centering
 \caption{Routing Mode Distribution (N=300)}
 \label{tab:mode-distribution}
 \begin{tabular}{llccc}
 \toprule
 Topology & Embedding & Gravity \% & Pressure \% & Tree \% \\
-\midrule
-"""
+\midrule"""]
     
     for topo in topologies:
-        row_data = [d for d in data if d['topology'] == topo and d['n'] == scale]
+        row_data = by_config.get((topo, scale))
         if not row_data:
             continue
             
@@ -165,50 +177,50 @@ Topology & Embedding & Gravity \% & Pressure \% & Tree \% \\
             tree = d['tree_ratio'] * 100
             
             line += f" & {gravity:.1f}\\% & {pressure:.1f}\\% & {tree:.1f}\\% \\\\"
-            latex += line + "\n"
+            parts.append(line)
         
-        latex += r"\midrule" + "\n"
+        parts.append(r"\midrule")
     
-    latex += r"""\bottomrule
+    parts.append(r"""\bottomrule
 \end{tabular}
-\end{table}
-"""
-    return latex
+\end{table}""")
+    return "\n".join(parts) + "\n"
 
 def generate_summary_analysis(data):
     """Generate summary statistics for paper."""
     
-    summary = {
-        'PIE': {'success': [], 'hops': [], 'gravity': []},
-        'Random': {'success': [], 'hops': [], 'gravity': []},
-        'Ricci-Broken': {'success': [], 'hops': [], 'gravity': []},
-        'Ricci-Fixed': {'success': [], 'hops': [], 'gravity': []},
-    }
+    embeddings = ['PIE', 'Random', 'Ricci-Broken', 'Ricci-Fixed']
+    # Running totals per embedding: [count, success, hops, gravity]
+    totals = {emb: [0, 0.0, 0.0, 0.0] for emb in embeddings}
     
     # Focus on realistic topologies
-    realistic = ['ba', 'ws', 'grid']
+    realistic = {'ba', 'ws', 'grid'}
     
     for d in data:
         if d['topology'] in realistic and d['n'] >= 100:
-            emb = d['embedding']
-            if emb in summary:
-                summary[emb]['success'].append(d['success_rate'])
-                summary[emb]['hops'].append(d['avg_hops'])
-                summary[emb]['gravity'].append(d['gravity_ratio'])
+            acc = totals.get(d['embedding'])
+            if acc is not None:
+                acc[0] += 1
+                acc[1] += d['success_rate']
+                acc[2] += d['avg_hops']
+                acc[3] += d['gravity_ratio']
     
-    analysis = "## Summary Analysis for Paper\n\n"
-    analysis += "| Embedding | Avg Success | Avg Hops | Avg Gravity % |\n"
-    analysis += "|-----------|------------|----------|---------------|\n"
+    parts = [
+        "## Summary Analysis for Paper",
+        "",
+        "| Embedding | Avg Success | Avg Hops | Avg Gravity % |",
+        "|-----------|------------|----------|---------------|",
+    ]
     
-    for emb in ['PIE', 'Random', 'Ricci-Broken', 'Ricci-Fixed']:
-        s = summary[emb]
-        avg_success = sum(s['success']) / len(s['success']) if s['success'] else 0
-        avg_hops = sum(s['hops']) / len(s['hops']) if s['hops'] else 0
-        avg_gravity = sum(s['gravity']) / len(s['gravity']) if s['gravity'] else 0
+    for emb, (count, success, hops, gravity) in totals.items():
+        if count:
+            avg_success, avg_hops, avg_gravity = success / count, hops / count, gravity / count
+        else:
+            avg_success = avg_hops = avg_gravity = 0
         
-        analysis += f"| {emb} | {avg_success*100:.1f}% | {avg_hops:.1f} | {avg_gravity*100:.1f}% |\n"
+        parts.append(f"| {emb} | {avg_success*100:.1f}% | {avg_hops:.1f} | {avg_gravity*100:.1f}% |")
     
-    return analysis
+    return "\n".join(parts) + "\n"
 
 def main():
     base_path = Path("paper_data")
@@ -221,21 +233,23 @@ def main():
     data = load_csv_data(csv_path)
     print(f"Loaded {len(data)} experiment results")
     
+    by_config, by_key = index_data(data)
+    
     # Generate LaTeX tables
     tables_dir = base_path / "tables"
     tables_dir.mkdir(exist_ok=True)
     
-    success_table = generate_latex_success_table(data)
+    success_table = generate_latex_success_table(by_config, by_key)
     with open(tables_dir / "success_rate_table.tex", 'w') as f:
         f.write(success_table)
     print("✓ Generated success_rate_table.tex")
     
-    hops_table = generate_latex_hops_table(data)
+    hops_table = generate_latex_hops_table(by_config, by_key)
     with open(tables_dir / "avg_hops_table.tex", 'w') as f:
         f.write(hops_table)
     print("✓ Generated avg_hops_table.tex")
     
-    mode_table = generate_hop_breakdown_table(data)
+    mode_table = generate_hop_breakdown_table(by_config)
     with open(tables_dir / "mode_distribution_table.tex", 'w') as f:
         f.write(mode_table)
     print("✓ Generated mode_distribution_table.tex")
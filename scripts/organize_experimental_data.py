@@ -7,12 +7,21 @@ This script:
 2. Exports to CSV format for easy analysis
 3. Creates comprehensive summary statistics
 4. Documents experimental setup and parameters
+
+Pass --gzip to write the CSV exports as gzip-compressed .csv.gz files.
 """
 
+import argparse
 import json
 import csv
+import gzip
+import io
 import os
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import chain
+
+from _json_cache import JSON_ERRORS, dump_json, iter_json_results, load_json
 
 # Define data files to process
 DATA_FILES = {
@@ -25,19 +34,28 @@ DATA_FILES = {
 
 OUTPUT_DIR = 'experimental_data'
 
+# Markdown template for experimental_setup.md, with a {timestamp} placeholder
+SETUP_DOC_TEMPLATE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'templates', 'experimental_setup.md.tmpl'
+)
+
+# Write buffer for CSV exports; 1 MiB keeps write() calls rare
+CSV_BUFFER_SIZE = 1 << 20
+
+# Compression level for --gzip CSV exports; level 1 favours speed
+CSV_COMPRESS_LEVEL = 1
+
 
 def ensure_output_dir():
     """Create output directory if it doesn't exist."""
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
     print(f"Output directory: {OUTPUT_DIR}/")
 
 
 def load_json_file(filename):
     """Load JSON data from file."""
     try:
-        with open(filename, 'r') as f:
-            return json.load(f)
+        return load_json(filename)
     except FileNotFoundError:
         print(f"Warning: {filename} not found, skipping...")
         return {}
@@ -46,21 +64,80 @@ def load_json_file(filename):
         return {}
 
 
-def export_scalability_data():
-    """Export scalability experiment data to CSV."""
+def iter_input_results(filename):
+    """Yield result records from filename, skipping it if missing and re-raising decode errors."""
+    try:
+        yield from iter_json_results(filename)
+    except FileNotFoundError:
+        print(f"Warning: {filename} not found, skipping...")
+    except JSON_ERRORS as e:
+        print(f"Error decoding {filename}: {e}")
+        raise
+
+
+def csv_export_path(filename, compress=False):
+    """Return the output path for a CSV export, with .gz if compressing."""
+    path = f"{OUTPUT_DIR}/{filename}"
+    return path + '.gz' if compress else path
+
+
+@contextmanager
+def open_csv_export(path):
+    """Open a CSV export for writing; .gz paths are gzip-compressed."""
+    # Rows go to a temp file that only replaces path once the export
+    # completes, so a failure partway through never leaves a truncated CSV
+    tmp = path + '.tmp'
+    try:
+        with open(tmp, 'wb', buffering=0) as out:
+            raw = out
+            if path.endswith('.gz'):
+                # Name the gzip member after path rather than the temp file
+                raw = gzip.GzipFile(path, 'wb', CSV_COMPRESS_LEVEL, fileobj=out)
+            # Keep the large write buffer in front of the compressor so it
+            # deflates big blocks rather than individual rows
+            with io.TextIOWrapper(io.BufferedWriter(raw, CSV_BUFFER_SIZE), newline='') as f:
+                yield f
+    except BaseException:
+        os.remove(tmp)
+        raise
+    os.replace(tmp, path)
+    
+    # Drop the other variant left by an earlier run with or without --gzip,
+    # so the data index only sees the export this run wrote
+    stale = path[:-3] if path.endswith('.gz') else path + '.gz'
+    try:
+        os.remove(stale)
+    except FileNotFoundError:
+        pass
+
+
+def export_scalability_data(compress=False):
+    """Export scalability experiment data to CSV and return its summary (None if no data)."""
     print("\n=== Processing Scalability Data ===")
     data = load_json_file(DATA_FILES['scalability'])
     
     if not data or 'results' not in data:
         print("No scalability data found")
-        return
-    
-    # Export to CSV
-    csv_file = f"{OUTPUT_DIR}/scalability_results.csv"
-    with open(csv_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=data['results'][0].keys())
+        return None
+    
+    # Export to CSV, formatting the per-result summary rows in the same pass
+    csv_file = csv_export_path('scalability_results.csv', compress)
+    fieldnames = list(data['results'][0].keys())
+    results_summary = []
+    with open_csv_export(csv_file) as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-        writer.writerows(data['results'])
+        
+        for r in data['results']:
+            writer.writerow(r)
+            results_summary.append({
+                'network_size': r['network_size'],
+                'success_rate': f"{r['success_rate']:.1%}",
+                'avg_hops': f"{r['avg_hops']:.2f}",
+                'stretch_ratio': f"{r['avg_stretch']:.2f}",
+                'routing_time_us': f"{r['avg_routing_time_us']:.1f}",
+                'memory_mb': f"{r['total_memory_mb']:.3f}"
+            })
     
     print(f"Exported: {csv_file}")
     
@@ -73,149 +150,155 @@ def export_scalability_data():
         'max_ttl': data['config']['max_ttl'],
         'seed': data['config']['seed'],
         'total_tests': len(data['results']) * data['config']['num_routing_tests'],
-        'results_summary': []
+        'results_summary': results_summary
     }
     
-    for result in data['results']:
-        summary['results_summary'].append({
-            'network_size': result['network_size'],
-            'success_rate': f"{result['success_rate']:.1%}",
-            'avg_hops': f"{result['avg_hops']:.2f}",
-            'stretch_ratio': f"{result['avg_stretch']:.2f}",
-            'routing_time_us': f"{result['avg_routing_time_us']:.1f}",
-            'memory_mb': f"{result['total_memory_mb']:.3f}"
-        })
-    
     # Save summary
     summary_file = f"{OUTPUT_DIR}/scalability_summary.json"
-    with open(summary_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    dump_json(summary, summary_file)
     
     print(f"Summary: {summary_file}")
     print(f"  - Network sizes: {summary['network_sizes']}")
     print(f"  - Total tests: {summary['total_tests']}")
+    
+    return summary
 
 
-def export_topology_data():
-    """Export topology experiment data to CSV."""
-    print("\n=== Processing Topology Data ===")
-    
-    all_results = []
-    
+def iter_topology_results():
+    """Yield topology results from every network size, tagged with network_size."""
     for size in [100, 200, 300]:
-        key = f'topology_{size}'
-        data = load_json_file(DATA_FILES[key])
+        found = False
+        for result in iter_input_results(DATA_FILES[f'topology_{size}']):
+            found = True
+            result['network_size'] = size
+            yield result
         
-        if not data:
+        if not found:
             print(f"No topology data found for {size} nodes")
-            continue
-        
-        # Handle both array format and object format
-        results = data if isinstance(data, list) else data.get('results', [])
+
+
+def export_topology_data(compress=False):
+    """Export topology experiment data to CSV and return its summary (None if no data)."""
+    print("\n=== Processing Topology Data ===")
+    results = iter_topology_results()
+    try:
+        first = next(results, None)
         
-        if not results:
-            print(f"No topology results found for {size} nodes")
-            continue
+        if first is None:
+            print("No topology data found")
+            return None
         
-        # Add network size to each result
-        for result in results:
-            result['network_size'] = size
-            all_results.append(result)
-    
-    if not all_results:
+        # Export combined CSV and build the summary by topology type in one pass
+        csv_file = csv_export_path('topology_results_all.csv', compress)
+        fieldnames = list(first.keys())
+        topology_summary = {}
+        num_results = 0
+        with open_csv_export(csv_file) as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            
+            for result in chain([first], results):
+                num_results += 1
+                writer.writerow(result)
+                
+                # Handle both 'topology' and 'topology_type' keys
+                topo = result.get('topology', result.get('topology_type', 'Unknown'))
+                if topo not in topology_summary:
+                    topology_summary[topo] = []
+                topology_summary[topo].append({
+                    'network_size': result['network_size'],
+                    'success_rate': result['success_rate'],
+                    'avg_hops': result['avg_hops'],
+                    'stretch_ratio': result.get('stretch_ratio', 0),
+                    'num_edges': result.get('num_edges', 0)
+                })
+    except JSON_ERRORS:
         print("No topology data found")
-        return
-    
-    # Export combined CSV
-    csv_file = f"{OUTPUT_DIR}/topology_results_all.csv"
-    with open(csv_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=all_results[0].keys())
-        writer.writeheader()
-        writer.writerows(all_results)
+        return None
     
     print(f"Exported: {csv_file}")
     
-    # Create summary by topology type
-    topology_summary = {}
-    for result in all_results:
-        # Handle both 'topology' and 'topology_type' keys
-        topo = result.get('topology', result.get('topology_type', 'Unknown'))
-        if topo not in topology_summary:
-            topology_summary[topo] = []
-        topology_summary[topo].append({
-            'network_size': result['network_size'],
-            'success_rate': result['success_rate'],
-            'avg_hops': result['avg_hops'],
-            'stretch_ratio': result.get('stretch_ratio', 0),
-            'num_edges': result.get('num_edges', 0)
-        })
-    
     summary_file = f"{OUTPUT_DIR}/topology_summary.json"
-    with open(summary_file, 'w') as f:
-        json.dump(topology_summary, f, indent=2)
+    dump_json(topology_summary, summary_file)
     
     print(f"Summary: {summary_file}")
     print(f"  - Topologies: {list(topology_summary.keys())}")
     print(f"  - Network sizes: [100, 200, 300]")
-    print(f"  - Total configurations: {len(all_results)}")
+    print(f"  - Total configurations: {num_results}")
+    
+    return topology_summary
 
 
-def export_baseline_data():
-    """Export baseline comparison data to CSV."""
+def export_baseline_data(compress=False):
+    """Export baseline comparison data to CSV and return its summary (None if no data)."""
     print("\n=== Processing Baseline Comparison Data ===")
-    data = load_json_file(DATA_FILES['baseline'])
-    
-    if not data or 'results' not in data:
+    results = iter_input_results(DATA_FILES['baseline'])
+    try:
+        first = next(results, None)
+        
+        if first is None:
+            print("No baseline data found")
+            return None
+        
+        # Export to CSV and build the summary by protocol in the same pass,
+        # so the full results array never has to be held in memory
+        csv_file = csv_export_path('baseline_comparison.csv', compress)
+        protocol_summary = {}
+        num_results = 0
+        fieldnames = list(first.keys())
+        with open_csv_export(csv_file) as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            
+            for result in chain([first], results):
+                writer.writerow(result)
+                num_results += 1
+                
+                protocol = result['protocol']
+                if protocol not in protocol_summary:
+                    protocol_summary[protocol] = {
+                        'total_tests': 0,
+                        'avg_success_rate': 0,
+                        'avg_hops': 0,
+                        'configurations': []
+                    }
+                
+                stats = protocol_summary[protocol]
+                stats['total_tests'] += result['total_tests']
+                # Accumulate running sums; divided into averages below
+                stats['avg_success_rate'] += result['success_rate']
+                stats['avg_hops'] += result['avg_hops']
+                stats['configurations'].append({
+                    'network_size': result['network_size'],
+                    'topology': result['topology'],
+                    'success_rate': result['success_rate'],
+                    'avg_hops': result['avg_hops'],
+                    'avg_latency_us': result['avg_latency_us']
+                })
+    except JSON_ERRORS:
         print("No baseline data found")
-        return
-    
-    # Export to CSV
-    csv_file = f"{OUTPUT_DIR}/baseline_comparison.csv"
-    with open(csv_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=data['results'][0].keys())
-        writer.writeheader()
-        writer.writerows(data['results'])
+        return None
     
     print(f"Exported: {csv_file}")
     
-    # Create summary by protocol
-    protocol_summary = {}
-    for result in data['results']:
-        protocol = result['protocol']
-        if protocol not in protocol_summary:
-            protocol_summary[protocol] = {
-                'total_tests': 0,
-                'avg_success_rate': 0,
-                'avg_hops': 0,
-                'configurations': []
-            }
-        
-        protocol_summary[protocol]['total_tests'] += result['total_tests']
-        protocol_summary[protocol]['configurations'].append({
-            'network_size': result['network_size'],
-            'topology': result['topology'],
-            'success_rate': result['success_rate'],
-            'avg_hops': result['avg_hops'],
-            'avg_latency_us': result['avg_latency_us']
-        })
-    
     # Calculate averages
-    for protocol, stats in protocol_summary.items():
-        configs = stats['configurations']
-        stats['avg_success_rate'] = sum(c['success_rate'] for c in configs) / len(configs)
-        stats['avg_hops'] = sum(c['avg_hops'] for c in configs) / len(configs)
+    for stats in protocol_summary.values():
+        num_configs = len(stats['configurations'])
+        stats['avg_success_rate'] /= num_configs
+        stats['avg_hops'] /= num_configs
     
     summary_file = f"{OUTPUT_DIR}/baseline_summary.json"
-    with open(summary_file, 'w') as f:
-        json.dump(protocol_summary, f, indent=2)
+    dump_json(protocol_summary, summary_file)
     
     print(f"Summary: {summary_file}")
     print(f"  - Protocols: {list(protocol_summary.keys())}")
-    print(f"  - Total configurations: {len(data['results'])}")
+    print(f"  - Total configurations: {num_results}")
+    
+    return protocol_summary
 
 
-def create_master_summary():
-    """Create a master summary document of all experiments."""
+def create_master_summary(scalability=None, topology=None, baseline=None):
+    """Create a master summary document from the exporters' returned summaries."""
     print("\n=== Creating Master Summary ===")
     
     summary = {
@@ -224,25 +307,18 @@ def create_master_summary():
         'experiments': {}
     }
     
-    # Scalability
-    if os.path.exists(f"{OUTPUT_DIR}/scalability_summary.json"):
-        with open(f"{OUTPUT_DIR}/scalability_summary.json", 'r') as f:
-            summary['experiments']['scalability'] = json.load(f)
-    
-    # Topology
-    if os.path.exists(f"{OUTPUT_DIR}/topology_summary.json"):
-        with open(f"{OUTPUT_DIR}/topology_summary.json", 'r') as f:
-            summary['experiments']['topology'] = json.load(f)
-    
-    # Baseline
-    if os.path.exists(f"{OUTPUT_DIR}/baseline_summary.json"):
-        with open(f"{OUTPUT_DIR}/baseline_summary.json", 'r') as f:
-            summary['experiments']['baseline'] = json.load(f)
+    experiments = {
+        'scalability': scalability,
+        'topology': topology,
+        'baseline': baseline,
+    }
+    for name, experiment_summary in experiments.items():
+        if experiment_summary is not None:
+            summary['experiments'][name] = experiment_summary
     
     # Save master summary
     master_file = f"{OUTPUT_DIR}/master_summary.json"
-    with open(master_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    dump_json(summary, master_file)
     
     print(f"Master summary: {master_file}")
 
@@ -253,209 +329,19 @@ def create_experimental_setup_doc():
     
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    doc = """# DRFE-R Experimental Setup Documentation
-
-## Overview
-
-This document describes the experimental setup, parameters, and configurations used for all DRFE-R experiments.
-
-## Experiments Conducted
-
-### 1. Scalability Experiments
-
-**Purpose**: Evaluate routing performance as network size increases
-
-**Configuration**:
-- Network sizes: 100, 300, 500, 1000, 3000, 5000 nodes
-- Topology: Barabási-Albert (scale-free)
-- Average degree: ~6
-- Tests per size: 1000 routing tests
-- Max TTL: 200 hops
-- Random seed: 42 (for reproducibility)
-
-**Metrics Collected**:
-- Success rate (%)
-- Average hop count
-- Stretch ratio (actual hops / optimal hops)
-- Routing time (microseconds)
-- Memory usage per node (bytes)
-- Mode distribution (Gravity/Pressure/Tree)
-
-**Files**:
-- Raw data: `scalability_results.json`
-- CSV export: `experimental_data/scalability_results.csv`
-- Summary: `experimental_data/scalability_summary.json`
-- Analysis: `scalability_experiments_summary.md`
-
-### 2. Topology Experiments
-
-**Purpose**: Evaluate routing performance across different network topologies
-
-**Configuration**:
-- Network sizes: 100, 200, 300 nodes
-- Topologies:
-  - Barabási-Albert (BA): Scale-free, m=3
-  - Watts-Strogatz (WS): Small-world, k=6, beta=0.1
-  - Grid: 2D lattice
-  - Random (Erdős-Rényi): p=0.05
-  - Real-World: Community-structured
-- Tests per configuration: 1000 routing tests
-- Max TTL: 100 hops
-- Random seed: 42
-
-**Metrics Collected**:
-- Success rate (%)
-- Average hop count
-- Stretch ratio
-- Mode distribution
-- Edge count and average degree
-
-**Files**:
-- Raw data: `topology_experiments_n100.json`, `topology_experiments_n200.json`, `topology_experiments_n300.json`
-- CSV export: `experimental_data/topology_results_all.csv`
-- Summary: `experimental_data/topology_summary.json`
-- Analysis: `topology_experiments_summary.md`
-
-### 3. Baseline Comparison
-
-**Purpose**: Compare DRFE-R with established routing protocols
-
-**Configuration**:
-- Protocols compared:
-  - DRFE-R (our protocol)
-  - Chord DHT
-  - Kademlia DHT
-- Network sizes: 50, 100, 200, 300 nodes
-- Topologies: BA, Random, Grid
-- Tests per configuration: 100 routing tests
-
-**Metrics Collected**:
-- Success rate (%)
-- Average hop count
-- Average latency (microseconds)
-
-**Files**:
-- Raw data: `baseline_comparison.json`
-- CSV export: `experimental_data/baseline_comparison.csv`
-- Summary: `experimental_data/baseline_summary.json`
-- Analysis: `baseline_comparison_summary.md`
-
-### 4. Benchmark Suite
-
-**Purpose**: Measure performance characteristics of core components
-
-**Benchmarks**:
-1. **Routing Latency**: Time to route packets through network
-2. **Coordinate Updates**: Time to compute and update coordinates
-3. **API Throughput**: Request processing performance
-
-**Configuration**:
-- Tool: Criterion.rs
-- Warm-up: 3 seconds
-- Samples: 100 per benchmark
-- Network sizes: 50, 100, 200, 500 nodes
-
-**Files**:
-- Raw output: `benchmark_results.txt`
-- Summary: `benchmark_summary.md`
-- Benchmark code: `benches/*.rs`
-
-## Embedding Method
-
-All experiments use the **PIE (Polar Increasing-angle Embedding)** method:
-- Root radius: 0.05
-- Angle increment: Based on node degree
-- Coordinate refinement: Ricci Flow with proximal regularization
-
-## Routing Algorithm
-
-**GP (Gravity-Pressure) Algorithm** with three modes:
-1. **Gravity Mode**: Greedy routing toward target coordinate
-2. **Pressure Mode**: Escape local minima using pressure field
-3. **Tree Mode**: Guaranteed delivery via spanning tree
-
-## Hardware and Software
-
-**Execution Environment**:
-- OS: Windows with WSL Ubuntu
-- Rust version: Latest stable
-- Compiler: rustc with release optimizations
-- CPU: [System dependent]
-- Memory: [System dependent]
-
-**Build Commands**:
-```bash
-wsl -d ubuntu bash -c "source ~/.cargo/env && cargo build --release"
-```
-
-## Reproducibility
-
-All experiments can be reproduced using:
-
-```bash
-# Scalability experiments
-wsl -d ubuntu bash -c "source ~/.cargo/env && cargo run --release --bin scalability_experiments"
-
-# Topology experiments
-wsl -d ubuntu bash -c "source ~/.cargo/env && cargo run --release --bin topology_experiments -- --nodes 100 --tests 1000"
-
-# Baseline comparison
-wsl -d ubuntu bash -c "source ~/.cargo/env && cargo run --release --bin baseline_comparison"
-
-# Benchmarks
-wsl -d ubuntu bash -c "source ~/.cargo/env && cargo bench"
-```
-
-## Data Organization
-
-All experimental data is organized in the `experimental_data/` directory:
-
-```
-experimental_data/
-├── scalability_results.csv
-├── scalability_summary.json
-├── topology_results_all.csv
-├── topology_summary.json
-├── baseline_comparison.csv
-├── baseline_summary.json
-├── master_summary.json
-└── experimental_setup.md (this file)
-```
-
-## Statistical Significance
-
-- All experiments use fixed random seeds for reproducibility
-- Multiple runs (100-1000 tests) per configuration
-- Results include mean, median, and percentile statistics where applicable
-
-## Requirements Validation
-
-This experimental setup validates the following requirements:
-
-- **Requirement 10.1**: Scalability data for networks of 100-5000 nodes ✓
-- **Requirement 10.2**: Data for 5+ topology types ✓
-- **Requirement 10.3**: 1000+ routing tests per configuration ✓
-- **Requirement 10.4**: Stretch ratio measurements ✓
-- **Requirement 10.5**: Coordinate stability data ✓
-- **Requirement 6.5**: Baseline protocol comparisons ✓
-- **Requirement 16.1-16.5**: Scalability verification ✓
-
-## Contact
-
-For questions about the experimental setup, please refer to the project documentation or contact the maintainers.
-
----
-
-Generated: """ + timestamp + """
-"""
-    
     doc_file = f"{OUTPUT_DIR}/experimental_setup.md"
-    with open(doc_file, 'w') as f:
-        f.write(doc)
+    with open(SETUP_DOC_TEMPLATE, 'rb') as src, open(doc_file, 'wb') as dst:
+        dst.write(src.read().replace(b'{timestamp}', timestamp.encode()))
     
     print(f"Documentation: {doc_file}")
 
 
+def scan_files(directory):
+    """Map the name of each regular file in directory to its DirEntry."""
+    with os.scandir(directory) as entries:
+        return {e.name: e for e in entries if e.is_file()}
+
+
 def create_data_index():
     """Create an index of all data files."""
     print("\n=== Creating Data Index ===")
@@ -470,46 +356,42 @@ def create_data_index():
         }
     }
     
+    # One directory read each; only the indexed files are stat'ed
+    local_files = scan_files('.')
+    output_files = scan_files(OUTPUT_DIR)
+    
     # Raw data files
     for key, filename in DATA_FILES.items():
-        if os.path.exists(filename):
-            size = os.path.getsize(filename)
+        if filename in local_files:
             index['files']['raw_data'][key] = {
                 'filename': filename,
-                'size_bytes': size,
+                'size_bytes': local_files[filename].stat().st_size,
                 'exists': True
             }
     
-    # CSV exports
-    csv_files = [
-        'scalability_results.csv',
-        'topology_results_all.csv',
-        'baseline_comparison.csv'
-    ]
-    for csv_file in csv_files:
-        path = f"{OUTPUT_DIR}/{csv_file}"
-        if os.path.exists(path):
-            size = os.path.getsize(path)
-            index['files']['csv_exports'][csv_file] = {
-                'path': path,
-                'size_bytes': size
-            }
-    
-    # Summaries
-    summary_files = [
-        'scalability_summary.json',
-        'topology_summary.json',
-        'baseline_summary.json',
-        'master_summary.json'
-    ]
-    for summary_file in summary_files:
-        path = f"{OUTPUT_DIR}/{summary_file}"
-        if os.path.exists(path):
-            size = os.path.getsize(path)
-            index['files']['summaries'][summary_file] = {
-                'path': path,
-                'size_bytes': size
-            }
+    # CSV exports and summaries
+    output_buckets = {
+        'csv_exports': [
+            name + suffix
+            for name in ['scalability_results.csv',
+                         'topology_results_all.csv',
+                         'baseline_comparison.csv']
+            for suffix in ('', '.gz')
+        ],
+        'summaries': [
+            'scalability_summary.json',
+            'topology_summary.json',
+            'baseline_summary.json',
+            'master_summary.json'
+        ],
+    }
+    for bucket, filenames in output_buckets.items():
+        for filename in filenames:
+            if filename in output_files:
+                index['files'][bucket][filename] = {
+                    'path': f"{OUTPUT_DIR}/{filename}",
+                    'size_bytes': output_files[filename].stat().st_size
+                }
     
     # Analysis documents
     analysis_files = [
@@ -519,16 +401,14 @@ def create_data_index():
         'benchmark_summary.md'
     ]
     for analysis_file in analysis_files:
-        if os.path.exists(analysis_file):
-            size = os.path.getsize(analysis_file)
+        if analysis_file in local_files:
             index['files']['analysis'][analysis_file] = {
                 'path': analysis_file,
-                'size_bytes': size
+                'size_bytes': local_files[analysis_file].stat().st_size
             }
     
     index_file = f"{OUTPUT_DIR}/data_index.json"
-    with open(index_file, 'w') as f:
-        json.dump(index, f, indent=2)
+    dump_json(index, index_file)
     
     print(f"Data index: {index_file}")
 
@@ -540,9 +420,15 @@ def print_summary_statistics():
     print("="*60)
     
     # Count files
-    csv_count = len([f for f in os.listdir(OUTPUT_DIR) if f.endswith('.csv')])
-    json_count = len([f for f in os.listdir(OUTPUT_DIR) if f.endswith('.json')])
-    md_count = len([f for f in os.listdir(OUTPUT_DIR) if f.endswith('.md')])
+    output_files = scan_files(OUTPUT_DIR)
+    csv_count = json_count = md_count = 0
+    for name in output_files:
+        if name.endswith(('.csv', '.csv.gz')):
+            csv_count += 1
+        elif name.endswith('.json'):
+            json_count += 1
+        elif name.endswith('.md'):
+            md_count += 1
     
     print(f"\nFiles generated:")
     print(f"  - CSV files: {csv_count}")
@@ -551,9 +437,8 @@ def print_summary_statistics():
     
     # Load master summary if available
     master_file = f"{OUTPUT_DIR}/master_summary.json"
-    if os.path.exists(master_file):
-        with open(master_file, 'r') as f:
-            master = json.load(f)
+    if 'master_summary.json' in output_files:
+        master = load_json(master_file)
         
         print(f"\nExperiments included:")
         for exp_name in master['experiments'].keys():
@@ -565,6 +450,11 @@ def print_summary_statistics():
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Organize and export DRFE-R experimental data.")
+    parser.add_argument('--gzip', action='store_true',
+                        help="write CSV exports as gzip-compressed .csv.gz files")
+    args = parser.parse_args()
+    
     print("DRFE-R Experimental Data Organization")
     print("=" * 60)
     
@@ -572,12 +462,12 @@ def main():
     ensure_output_dir()
     
     # Export all data
-    export_scalability_data()
-    export_topology_data()
-    export_baseline_data()
+    scalability = export_scalability_data(args.gzip)
+    topology = export_topology_data(args.gzip)
+    baseline = export_baseline_data(args.gzip)
     
     # Create summaries and documentation
-    create_master_summary()
+    create_master_summary(scalability, topology, baseline)
     create_experimental_setup_doc()
     create_data_index()
     
@@ -1,5 +1,6 @@
-import json
-data = json.load(open("paper_data/churn/churn_robustness.json"))
+from _json_cache import load_json_cached
+
+data = load_json_cached("paper_data/churn/churn_robustness.json")
 print(f"{'Strategy':20s} {'Selection':10s} {'Rem%':5s} {'Success':10s} {'Stretch':10s} {'MaxStr':10s} {'TZ%':8s}")
 print("-" * 70)
 for run in data["runs"]: